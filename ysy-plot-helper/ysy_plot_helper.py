@@ -22,9 +22,13 @@ notebooks, scripts, and papers.
 Key Features
 ------------
 - `plot(...)`: one-call line/scatter plotting with sensible defaults and legend/title.
-- `temp_style(style_keys, extra_style)`: context manager that composes a temporary
-  `.mplstyle` file from selected presets and/or extra rcParams, applies it inside
-  the `with` block, and then cleanly restores Matplotlib defaults.
+- `temp_style(style_keys, extra_style)`: context manager that composes rcParams from
+  selected presets and/or extra `.mplstyle` lines, applies them inside the `with`
+  block, and then restores the previous rcParams.
+- `make_style(style_keys, extra_style)`: compose a style once and get a reusable
+  factory of context managers for it (`temp_style` is the one-shot form).
+- `refresh_presets()`: re-parse `PRESET_STYLES` after editing it at runtime.
+- `prebuild_font_cache()`: build Matplotlib's font cache ahead of time (image/CI builds).
 - `print_preset_styles()`: quick guide to available layout and color theme presets.
 - `PRESET_STYLES`: a dictionary of small, focused `.mplstyle` fragments. You can mix
   “layout” presets (sizes, ticks, fonts, legends, etc.) with “color” presets.
@@ -51,11 +55,19 @@ Composing with overrides:
 
 Notes & Limitations
 -------------------
-- Hex colors in `.mplstyle` usually require a leading '#'. Several presets below
-  use bare hex strings (e.g., '89b4fa'). If Matplotlib throws a parsing error on
-  your setup, prefix them with '#'.
-- The style manager writes a temporary `.mplstyle` file and removes it on exit.
-  If your program is interrupted mid-block, the file may linger in temp space.
+- Several presets below use bare hex strings (e.g., '89b4fa'), as `.mplstyle` files
+  must (an unquoted '#' starts a comment). The parser normalizes them to '#89b4fa'
+  once at import, both in `cycler(...)` lists and in `*color` values, so no preset
+  relies on Matplotlib's bare-hex fallback. `PRESET_STYLES` itself stays valid
+  `.mplstyle` text.
+- If Matplotlib's default config dir (`$XDG_CONFIG_HOME/matplotlib` or
+  `~/.config/matplotlib` on Linux) is not writable, `MPLCONFIGDIR` defaults to a
+  private per-user `<tempdir>/ysy-mpl-cache-<uid>` (POSIX only) so Matplotlib's font
+  cache is built once and reused across runs instead of per process. Set
+  `MPLCONFIGDIR` yourself to override. Call `prebuild_font_cache()` at image build
+  time to have it built before the first plot.
+- Presets are parsed into rcParams dicts once at import; the style manager applies
+  them in memory via `matplotlib.rc_context` and never touches the filesystem.
 - `plot` is intentionally simple. For complex layouts (subplots, twin axes,
   secondary scales, etc.), call Matplotlib directly and optionally wrap with
   `temp_style(...)`.
@@ -72,11 +84,71 @@ v1.6.0: Refactor script, remove unnecessary pieces, add IEEE theme.
 __version__ = "1.6.0"
 
 # Import necessary packages
-import matplotlib.pyplot as plt
+import contextlib, functools, math, os, re, stat, sys, tempfile, types, warnings
+
+
+def _default_mpl_configdir_usable():
+    """Whether the config dir Matplotlib resolves without MPLCONFIGDIR is usable."""
+    # Mirrors `matplotlib._get_config_or_cache_dir` (XDG on Linux/FreeBSD, else
+    # ~/.matplotlib), which likewise creates the directory before checking it.
+    if sys.platform.startswith(('linux', 'freebsd')):
+        base = (os.environ.get("XDG_CONFIG_HOME")
+                or os.path.join(os.path.expanduser("~"), ".config"))
+        path = os.path.join(base, "matplotlib")
+    else:
+        path = os.path.join(os.path.expanduser("~"), ".matplotlib")
+    try:
+        os.makedirs(path, exist_ok=True)
+    except OSError:
+        return False
+    return os.path.isdir(path) and os.access(path, os.W_OK)
+
+
+def _private_mpl_cache_dir():
+    """Return a stable per-user Matplotlib config dir in temp space, or None if unsafe."""
+    path = os.path.join(tempfile.gettempdir(), f"ysy-mpl-cache-{os.getuid()}")
+    try:
+        os.makedirs(path, mode=0o700, exist_ok=True)
+        st = os.lstat(path)
+    except OSError:
+        return None
+    # Matplotlib reads matplotlibrc and its font list from here, and temp space is
+    # shared: only trust a real directory we own that others cannot write to.
+    if (not stat.S_ISDIR(st.st_mode) or st.st_uid != os.getuid()
+            or st.st_mode & (stat.S_IWGRP | stat.S_IWOTH)):
+        return None
+    return path
+
+
+# When its default config dir is unusable (e.g. a read-only home without XDG overrides
+# in containers, CI, serverless), Matplotlib falls back to a fresh temporary dir and
+# rebuilds its font cache on every run. Point it at one stable private directory
+# instead, before Matplotlib is imported. Set MPLCONFIGDIR yourself to override; a
+# usable default (including XDG_CONFIG_HOME) keeps Matplotlib's own config untouched.
+if ("MPLCONFIGDIR" not in os.environ and "matplotlib" not in sys.modules
+        and hasattr(os, "getuid") and not _default_mpl_configdir_usable()):
+    _MPL_CACHE_DIR = _private_mpl_cache_dir()
+    if _MPL_CACHE_DIR is not None:
+        os.environ["MPLCONFIGDIR"] = _MPL_CACHE_DIR
+
+import numpy as np
+import matplotlib as mpl
 from cycler import cycler
 from matplotlib.colors import LinearSegmentedColormap  # Reserved for future custom colormaps
-import matplotlib.style as mplstyle
-import tempfile, os, contextlib
+try:
+    from matplotlib.style import _STYLE_BLACKLIST
+except ImportError:  # Matplotlib < 3.11
+    from matplotlib.style.core import STYLE_BLACKLIST as _STYLE_BLACKLIST
+
+
+def __getattr__(name):
+    # `matplotlib.pyplot` (backend setup) is imported on first use only, so working with
+    # the presets alone stays cheap. `yph.plt` still resolves for existing code.
+    if name == 'plt':
+        import matplotlib.pyplot as plt
+        globals()['plt'] = plt
+        return plt
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # =========================
@@ -93,6 +165,8 @@ def plot(
     plot_type: str = 'curve',
     legend_title: str = '',
     data_point=None,
+    ax=None,
+    show: bool = True,
 ):
     """
     Create a quick standardized plot (line or scatter) with minimal boilerplate.
@@ -104,10 +178,15 @@ def plot(
 
     y : array-like or list/tuple of array-like
         Y-axis data. If `y` is a list/tuple, each element is plotted as a separate series.
+        A 2-D NumPy array is also taken as several series, without copying: either
+        Matplotlib's layout `(len(x), n_series)` or `(n_series, len(x))` (used if the
+        first dimension does not match `len(x)`). A square array is always read in
+        Matplotlib's layout, i.e. each column is a series; pass `y.T` for rows.
 
     legend_name : str or list[str]
-        Legend label for the series. If `y` is a list/tuple, `legend_name` should be a
-        list of equal length providing a label for each series.
+        Legend label for the series. If `y` holds several series, `legend_name` should
+        be a list of equal length providing a label for each series; a single str is
+        used as the label of every series.
 
     plot_title : str, optional
         Figure title.
@@ -122,16 +201,31 @@ def plot(
         Plot as continuous lines ('curve') or points ('scatter'). Default 'curve'.
 
     legend_title : str, optional
-        Title for the legend box (empty by default).
+        Title for the legend box (empty by default). The legend is skipped entirely
+        when `legend_name` is empty (or all entries are) and no `data_point` is shown.
 
     data_point : tuple[float, float] | None, optional
         If provided *and* `y` is a single series, highlight one specific data point as
         an 'x' marker (zorder=2) on top of the line. Example: (x0, y0).
 
+    ax : matplotlib.axes.Axes | None, optional
+        Existing Axes to draw into. If None (default), a new figure and Axes are created.
+
+    show : bool, optional
+        Call `plt.show()` after drawing (default True). Pass False to keep adding to
+        `ax` and show or save the figure yourself.
+
     Returns
     -------
     None
-        Displays the plot via `plt.show()`.
+        Displays the plot via `plt.show()` unless `show=False`.
+
+    Raises
+    ------
+    ValueError
+        If `plot_type` is neither 'curve' nor 'scatter', or if `y` holds several series
+        and `legend_name` is a list with fewer labels than series (extra labels are
+        ignored).
 
     Examples
     --------
@@ -142,27 +236,77 @@ def plot(
         >>> y2 = np.cos(x)
         >>> plot(x, [y, y2], legend_name=['sin', 'cos'], plot_title='Trigs')
 
+    Parameter sweep into one figure (one figure, one render):
+        >>> fig, ax = plt.subplots()
+        >>> for k in (1, 2, 3):
+        ...     plot(x, np.sin(k * x), legend_name=f'k={k}', ax=ax, show=False)
+        >>> plt.show()
+
     Notes
     -----
-    - This helper uses a single Axes and calls `plt.show()` immediately.
+    - This helper draws on a single Axes (from `plt.subplots()` unless `ax` is given)
+      and by default calls `plt.show()` immediately.
     - For complex layouts, call Matplotlib directly or extend this function.
     """
-    plt.figure()
-
-    # Support plotting multiple series when y is a list/tuple.
-    if isinstance(y, tuple) or isinstance(y, list):
-        for i in range(len(y)):
-            if plot_type == 'curve':
-                plt.plot(x, y[i], label=legend_name[i])
-            elif plot_type == 'scatter':
-                plt.scatter(x, y[i], label=legend_name[i])
+    import matplotlib.pyplot as plt
+
+    # Checked once up front; the branches below then need no fall-through case.
+    if plot_type not in ('curve', 'scatter'):
+        raise ValueError(f"plot_type must be 'curve' or 'scatter', got {plot_type!r}")
+
+    if ax is None:
+        fig, ax = plt.subplots()
+
+    # Support plotting multiple series when y is a list/tuple or a 2-D array.
+    stacked_input = isinstance(y, np.ndarray) and y.ndim == 2
+    if stacked_input or isinstance(y, tuple) or isinstance(y, list):
+        if stacked_input:
+            # Already stacked, so only a view is taken. Matplotlib's layout is
+            # (n_points, n_series); (n_series, n_points) is transposed to match.
+            columns = y if y.shape[0] == len(x) else y.T
+        n_series = columns.shape[1] if stacked_input else len(y)
+        # Extra labels are ignored, as before; too few would leave series unlabelled.
+        if not isinstance(legend_name, str) and len(legend_name) < n_series:
+            raise ValueError(
+                f"legend_name has {len(legend_name)} labels for {n_series} series"
+            )
+        if plot_type == 'curve':
+            if not stacked_input:
+                # Stacking as (n_series, n_points) and transposing keeps every column
+                # a contiguous float64 view, so Matplotlib does not copy it per line.
+                # Masked series are stacked with np.ma so masked points stay gaps.
+                if any(np.ma.isMaskedArray(series) for series in y):
+                    stacked = np.ma.stack([np.ma.asarray(series) for series in y])
+                else:
+                    stacked = np.array([np.asarray(series) for series in y])
+                if stacked.dtype.kind in 'biuf':
+                    stacked = stacked.astype(float, copy=False)
+                # Only numeric/datetime/timedelta data stacks into something Matplotlib
+                # can draw column-wise; e.g. categorical (string) series cannot.
+                columns = stacked.T if stacked.dtype.kind in 'biufmM' else None
+            if columns is None:
+                lines = [line for series in y for line in ax.plot(x, series)]
+            else:
+                # One call draws every series: each column is a line.
+                lines = ax.plot(x, columns)
+            if isinstance(legend_name, str):
+                for line in lines:
+                    line.set_label(legend_name)
+            else:
+                for line, name in zip(lines, legend_name):
+                    line.set_label(name)
+        else:
+            # One collection per series keeps prop-cycle colors and legend entries.
+            for i, series in enumerate(columns.T if stacked_input else y):
+                label = legend_name if isinstance(legend_name, str) else legend_name[i]
+                ax.scatter(x, series, label=label)
     else:
         # Single series branch.
         if plot_type == 'curve':
-            plt.plot(x, y, label=legend_name, zorder=1)
+            ax.plot(x, y, label=legend_name, zorder=1)
             if data_point is not None:
                 # Highlight an individual point on top of the line.
-                plt.scatter(
+                ax.scatter(
                     data_point[0],
                     data_point[1],
                     label='Data Point',
@@ -170,15 +314,17 @@ def plot(
                     marker='x',
                     zorder=2,
                 )
-        elif plot_type == 'scatter':
-            plt.scatter(x, y, label=legend_name)
+        else:
+            ax.scatter(x, y, label=legend_name)
 
     # Standard labels/legend/title.
-    plt.xlabel(x_label)
-    plt.ylabel(y_label)
-    plt.title(plot_title)
-    plt.legend(title=legend_title)
-    plt.show()
+    ax.set(xlabel=x_label, ylabel=y_label, title=plot_title)
+    # A legend is only built when something is labelled (its layout is costly). Asking
+    # the Axes works for any `legend_name` type (str, list, ndarray, pandas Index).
+    if ax.get_legend_handles_labels()[1]:
+        ax.legend(title=legend_title)
+    if show:
+        plt.show()
     return None
 
 
@@ -186,18 +332,16 @@ def plot(
 # Style Manager
 # =========================
 
-@contextlib.contextmanager
-def temp_style(style_keys=None, extra_style: str = ""):
+def temp_style(style_keys=None, extra_style: str = "", after_reset: bool = False):
     """
     Temporarily apply a composed Matplotlib style built from preset snippets and/or
     an additional inline style string.
 
     This context manager:
-    1) concatenates the requested presets in order,
-    2) appends any `extra_style` rcParams lines,
-    3) writes them to a temporary `.mplstyle`,
-    4) applies it via `matplotlib.style.use`,
-    5) restores the default style and removes the temp file on exit.
+    1) merges the pre-parsed rcParams of the requested presets in order,
+    2) parses and merges any `extra_style` rcParams lines on top,
+    3) applies the result via `matplotlib.rc_context`,
+    4) restores the previous rcParams on exit.
 
     Parameters
     ----------
@@ -210,15 +354,21 @@ def temp_style(style_keys=None, extra_style: str = ""):
         Example:
             "lines.linewidth: 2.0\\naxes.grid: True\\n"
 
-    Yields
-    ------
-    None
-        Use inside a `with` block. All plotting within the block uses the composed style.
+    after_reset : bool, optional
+        If True, reset rcParams to Matplotlib's defaults before applying the style, so
+        settings from a local `matplotlibrc` or earlier `rcParams` edits do not leak
+        into the block. Default False (the style is layered on the current rcParams).
+
+    Returns
+    -------
+    contextlib.AbstractContextManager
+        Use in a `with` block. All plotting within the block uses the composed style.
 
     Raises
     ------
     ValueError
-        If any key in `style_keys` is not defined in `PRESET_STYLES`.
+        If any key in `style_keys` is not defined in `PRESET_STYLES` (all unknown keys
+        are listed in the message).
 
     Examples
     --------
@@ -233,51 +383,240 @@ def temp_style(style_keys=None, extra_style: str = ""):
 
     Notes
     -----
-    - If your process is killed inside the context, the temporary .mplstyle file may remain
-      in the temp directory. It is removed on normal exit.
+    - Nothing is written to disk; rcParams are restored even if the block raises.
+    - `temp_style()` with no styles (and `after_reset=False`) is a no-op wrapper.
     - Preset fragments are short by design; mix “layout” and “color” layers as needed.
+    - `axes.prop_cycle` layers over different properties (e.g. colors, then
+      `cycler('marker', [...])` in `extra_style`) are combined rather than replaced.
+    - To apply the same style in many blocks, build it once with `make_style`.
     """
-    combined_style = ""
-    if style_keys:
-        for key in style_keys:
-            if key in PRESET_STYLES:
-                combined_style += PRESET_STYLES[key] + "\n"
-            else:
-                raise ValueError(f"Unknown style key: {key}")
-    combined_style += extra_style
+    return _make_style(style_keys, extra_style, after_reset)()
 
-    # Write the composed style to a temporary .mplstyle file.
-    with tempfile.NamedTemporaryFile('w+', suffix='.mplstyle', delete=False) as tmp:
-        tmp.write(combined_style)
-        tmp_path = tmp.name
 
-    try:
-        # Apply the temporary style.
-        mplstyle.use(tmp_path)
+def make_style(style_keys=None, extra_style: str = "", after_reset: bool = False):
+    """
+    Compose a style once and return a factory for context managers that apply it.
+
+    Takes the same arguments as `temp_style`, but does the composition up front.
+    Each call of the returned factory gives a fresh context manager, so the style can
+    be entered any number of times; entering it only pushes/pops rcParams.
+
+    Returns
+    -------
+    callable
+        Zero-argument callable returning a context manager for the composed style.
+
+    Raises
+    ------
+    ValueError
+        If any key in `style_keys` is not defined in `PRESET_STYLES` (all unknown keys
+        are listed in the message).
+
+    Examples
+    --------
+        >>> academic = make_style(['ysy_academic', 'sky'])
+        >>> with academic():
+        ...     plot(x, y, legend_name='Series A')
+        >>> with academic():
+        ...     plot(x, y2, legend_name='Series B')
+    """
+    return _make_style(style_keys, extra_style, after_reset)
+
+
+def _make_style(style_keys, extra_style, after_reset):
+    """Shared body of `make_style`/`temp_style`; call it directly from those only."""
+    style_keys = tuple(style_keys or ())
+    if not style_keys and not extra_style and not after_reset:
+        # Nothing to apply: a no-op context, rcParams are not touched at all.
+        return contextlib.nullcontext
+    # Validate before the cache lookup so unknown keys always raise, all reported at once.
+    missing = set(style_keys) - _PRESET_KEYS
+    if missing:
+        raise ValueError(f"Unknown style keys: {sorted(missing)}")
+    merged, problems = _compose(style_keys, extra_style)
+    # The parse of `extra_style` is cached, but its warnings are issued on every call,
+    # pointing at the user's `make_style`/`temp_style` call (two frames up).
+    for problem in problems:
+        warnings.warn(problem, stacklevel=3)
+    return functools.partial(_rc_context, merged, after_reset)
+
+
+@contextlib.contextmanager
+def _rc_context(rc, after_reset: bool = False):
+    """Apply `rc` (optionally on top of Matplotlib defaults) for the `with` block."""
+    # rc_context restores the previous rcParams on exit, even on error.
+    with mpl.rc_context():
+        if after_reset:
+            mpl.rcdefaults()
+        mpl.rcParams.update(rc)
         yield
-    finally:
-        # Always restore defaults and clean up the temp file.
-        mplstyle.reload_library()
-        mplstyle.use('default')
-        os.remove(tmp_path)
 
 
-def print_preset_styles():
+@functools.lru_cache(maxsize=64)
+def _compose(style_keys: tuple, extra_style: str):
     """
-    Print a short guide to recommended style-loading patterns and available presets.
+    Merge preset rcParams in order, then `extra_style`; cached per combination.
 
-    This is a convenience inspector—useful for quick discovery at the REPL/Jupyter.
+    Returns the merged rcParams and the problems found in `extra_style`, which the
+    caller reports (a cache hit would otherwise swallow them).
+    """
+    extra_rc, problems = _scan_mplstyle(extra_style)
+    merged = {}
+    prop_cycle = None
+    layers = [_PARSED_PRESETS[key] for key in style_keys] + [extra_rc]
+    for rc in layers:
+        merged.update(rc)
+        if 'axes.prop_cycle' in rc:
+            prop_cycle = _combine_cycles(prop_cycle, rc['axes.prop_cycle'])
+    if prop_cycle is not None:
+        merged['axes.prop_cycle'] = prop_cycle
+    # Read-only view: the same mapping is shared by every cache hit.
+    return types.MappingProxyType(merged), problems
+
+
+def _combine_cycles(first, second):
+    """
+    Combine two prop cycles from successive style layers.
+
+    Cycles over disjoint properties (e.g. a color theme, then a linestyle cycle) are
+    zipped, each repeated to a common length so both keep cycling independently.
+    If they share a property, the later cycle replaces the earlier one.
     """
-    print('=== Recommended Loading Format ===')
-    print('with yph.temp_style(["ysy_academic", "sky"]):')
-    print()
-    print('=== Drawing Layout ===')
-    print("ysy_common, ysy_jupyter, sci_common, science (recommended), "
-          "ysy_academic (recommended), ieee (recommended)")
-    print()
-    print('=== Color Themes ===')
-    print(
-        '''catppuccin_mocha (dark, recommended),
+    if first is None or first.keys & second.keys:
+        return second
+    length = math.lcm(len(first), len(second))
+    return first * (length // len(first)) + second * (length // len(second))
+
+
+# Bare 6-digit hex colors: quoted (e.g. inside `cycler(...)`) or a whole rcParams value.
+_QUOTED_BARE_HEX = re.compile(r"(?<=['\"])([0-9a-fA-F]{6})(?=['\"])")
+_BARE_HEX = re.compile(r"[0-9a-fA-F]{6}")
+
+
+# One `.mplstyle` line: `key: value  # comment`. As in Matplotlib's own rc-file
+# parser, only double quotes protect a '#' (a lone "'" is an ordinary character),
+# and a trailing '\r' (CRLF text) is ignored. Any other non-blank, non-comment line,
+# including one with an unclosed double quote, lands in the last group.
+_STYLE_LINE = re.compile(
+    r"""^[ \t]*(?:
+        ([^\#\s:][^\#:\n]*?) [ \t]*:[ \t]*
+        ((?:[^\#"\n] | "[^"\n]*")*?) [ \t\r]*(?:\#.*)?
+      | ([^\#\s].*?)[ \t\r]*
+    )$""",
+    re.MULTILINE | re.VERBOSE,
+)
+
+
+def _parse_mplstyle(style: str) -> dict:
+    """Parse `.mplstyle` text into validated rcParams, warning about bad lines."""
+    rc, problems = _scan_mplstyle(style)
+    for problem in problems:
+        warnings.warn(problem)
+    return rc
+
+
+def _scan_mplstyle(style: str):
+    """
+    Parse `.mplstyle` text into a dict of validated rcParams plus a tuple of problems.
+
+    All lines are matched in one pass of `_STYLE_LINE` and each value is coerced by
+    Matplotlib's own rcParams validators, so e.g. `axes.prop_cycle` is stored as a
+    ready `Cycler` (evaluated in Matplotlib's restricted namespace) rather than as
+    source text to rebuild on every apply. Like `matplotlib.style.use` does for
+    files, bad lines are skipped (and described in the problems) instead of raising,
+    and so are keys unrelated to style such as `backend` (`rc_context` would not
+    restore those on exit).
+    """
+    rc = mpl.RcParams()
+    problems = []
+    for match in _STYLE_LINE.finditer(style):
+        key, value, bad = match.groups()
+        if bad is not None:
+            line_no = style.count('\n', 0, match.start()) + 1
+            problems.append(f"Cannot parse style line {line_no}: {bad!r}")
+            continue
+        # A leading '#' would start a comment in the .mplstyle text itself, so
+        # bare hex is normalized here rather than in the preset strings.
+        if key.endswith('color') and _BARE_HEX.fullmatch(value):
+            value = '#' + value
+        elif 'cycler(' in value:
+            value = _QUOTED_BARE_HEX.sub(r"#\1", value)
+        if key in _STYLE_BLACKLIST:
+            line_no = style.count('\n', 0, match.start()) + 1
+            problems.append(
+                f"Style line {line_no} sets {key!r}, which is not related to style; "
+                f"ignoring it"
+            )
+            continue
+        try:
+            rc[key] = value
+        except (KeyError, ValueError) as err:
+            line_no = style.count('\n', 0, match.start()) + 1
+            problems.append(f"Bad style line {line_no} ({key}: {value!r}): {err}")
+    return dict(rc), tuple(problems)
+
+
+def refresh_presets():
+    """
+    Re-parse `PRESET_STYLES` into the rcParams dicts used by `temp_style`.
+
+    Presets are parsed once at import, so call this after adding or editing entries
+    of `PRESET_STYLES` at runtime. Nothing is read from disk.
+
+    Examples
+    --------
+        >>> PRESET_STYLES['my_theme'] = "axes.prop_cycle: cycler('color', ['k', 'r'])"
+        >>> refresh_presets()
+        >>> with temp_style(['science', 'my_theme']):
+        ...     plot(x, y, legend_name='Series C')
+    """
+    global _PARSED_PRESETS, _PRESET_KEYS
+    # Read-only, so cached compositions cannot be invalidated by stray mutation.
+    _PARSED_PRESETS = types.MappingProxyType({
+        key: types.MappingProxyType(_parse_mplstyle(style))
+        for key, style in PRESET_STYLES.items()
+    })
+    _PRESET_KEYS = frozenset(_PARSED_PRESETS)
+    _compose.cache_clear()
+    return None
+
+
+def prebuild_font_cache():
+    """
+    Build Matplotlib's font cache now and report preset fonts missing on this system.
+
+    Run it once at image/CI build time, e.g.
+    `python -c "import ysy_plot_helper as yph; yph.prebuild_font_cache()"`, so the font
+    list is saved to Matplotlib's cache dir (see the MPLCONFIGDIR note above) and later
+    runs skip the system font scan.
+
+    Returns
+    -------
+    list[str]
+        Fonts named in the presets' `font.serif` / `font.sans-serif` lists that are not
+        installed; Matplotlib falls back to the next entry or its default for these.
+    """
+    from matplotlib import font_manager  # Importing it builds and saves the font list.
+
+    installed = {font.name for font in font_manager.fontManager.ttflist}
+    wanted = {
+        name
+        for rc in _PARSED_PRESETS.values()
+        for key in ('font.serif', 'font.sans-serif')
+        for name in rc.get(key, ())
+    }
+    return sorted(wanted - installed)
+
+
+_PRESET_STYLES_HELP = """\
+=== Recommended Loading Format ===
+with yph.temp_style(["ysy_academic", "sky"]):
+
+=== Drawing Layout ===
+ysy_common, ysy_jupyter, sci_common, science (recommended), ysy_academic (recommended), ieee (recommended)
+
+=== Color Themes ===
+catppuccin_mocha (dark, recommended),
 catppuccin_latte (recommended),
 ysy_firefly_1 (lightweight),
 science_color (lightweight),
@@ -291,8 +630,19 @@ cold_nature (lightweight),
 mondrian_dunghuang (lightweight),
 sky2 (lightweight),
 ieee_color (lightweight)
-'''
-    )
+
+"""
+
+
+def print_preset_styles():
+    """
+    Print a short guide to recommended style-loading patterns and available presets.
+
+    This is a convenience inspector—useful for quick discovery at the REPL/Jupyter.
+    The guide is a prebuilt string written in one go (a single output message in Jupyter).
+    """
+    sys.stdout.write(_PRESET_STYLES_HELP)
+    sys.stdout.flush()
     return None
 
 
@@ -751,3 +1101,6 @@ axes.prop_cycle: cycler('color', ['388ef7', 'f7786b', '91dce8', 'd16d7c', '766c9
 axes.prop_cycle : (cycler('color', ['k', 'r', 'b', 'g']) + cycler('ls', ['-', '--', ':', '-.']))
 """,
 }
+
+# Parsed once at import so `temp_style` only has to merge dicts.
+refresh_presets()